@@ -32,7 +32,6 @@ The process queue supports logging of the stderr output of the executed processe
 into a rotating logfile and fluent server.
 """
 
-import pickle
 import time
 from datetime import datetime
 import queue as standard_queue
@@ -45,6 +44,7 @@ import platform
 import sys
 import atexit
 from .resources_logger import ResourceLogger
+from .response_document import encode_response_document, decode_response_document
 
 has_fluent = False
 
@@ -209,7 +209,7 @@ class EnqueuedProcess(object):
                                                      self.resource_id)
 
             if response_data is not None:
-                http_code, response_model = pickle.loads(response_data)
+                http_code, response_model = decode_response_document(response_data)
                 if response_model["status"] != "error" and \
                         response_model["status"] != "terminated" and \
                         response_model["status"] != "timeout":
@@ -231,7 +231,7 @@ class EnqueuedProcess(object):
 
         # Send the termination response
         if response_data is not None:
-            http_code, response_model = pickle.loads(response_data)
+            http_code, response_model = decode_response_document(response_data)
             # print("Resource", http_code, response_model)
             response_model["status"] = status
             response_model["message"] = "The process was terminated by the server: %s" % message
@@ -240,7 +240,7 @@ class EnqueuedProcess(object):
             response_model["datetime"] = str(datetime.now())
             response_model["time_delta"] = response_model["timestamp"] - orig_time
 
-            document = pickle.dumps([http_code, response_model])
+            document = encode_response_document(http_code, response_model)
 
             self.resource_logger.commit(user_id=self.user_id,
                                         resource_id=self.resource_id,
@@ -157,6 +157,33 @@ class RedisLockingInterface(object):
         #print "Lock", expiration, self.lock_prefix + str(resource_id), str(self)
         return self.call_lock_resource(keys=keys)
 
+    def lock_many(self, resource_ids, expiration=30):
+        """Lock several resources for a specific time frame
+
+        All locks are requested in a single pipelined call to the Redis
+        server. Each lock is set independently of the others, hence
+        the caller must release the locks that were successfully acquired
+        if not all of them could be set.
+
+        This function will put a prefix before the resource names
+        to avoid key conflicts with other resources that are logged
+        in the Redis database.
+
+        Args:
+            resource_ids (list): List of resource names to lock, for example ["location/mapset",]
+            expiration (int): The time in seconds for which the locks are acquired
+
+        Returns:
+             list:
+             A list of booleans in the order of resource_ids, True for success and
+             False if unable to acquire the lock because the resource-lock already exists
+
+        """
+        pipe = self.redis_server.pipeline(transaction=False)
+        for resource_id in resource_ids:
+            pipe.set(self.lock_prefix + str(resource_id), 1, ex=expiration, nx=True)
+        return [bool(ret) for ret in pipe.execute()]
+
     def extend(self, resource_id, expiration=30):
         """Extent the expiration of a resource lock for a specific time frame
 
@@ -177,6 +204,30 @@ class RedisLockingInterface(object):
         #print "Extend Lock", expiration, self.lock_prefix + str(resource_id), str(self)
         return self.call_extend_resource_lock(keys=keys)
 
+    def extend_many(self, resource_ids, expiration=30):
+        """Extent the expiration of several resource locks for a specific time frame
+
+        All locks are extended in a single pipelined call to the Redis server.
+
+        This function will put a prefix before the resource names
+        to avoid key conflicts with other resources that are logged
+        in the Redis database.
+
+        Args:
+            resource_ids (list): List of resource names to extent the lock, for example ["location/mapset",]
+            expiration (int): The time in seconds for which the locks are acquired
+
+        Returns:
+            list:
+            A list of booleans in the order of resource_ids, True for success and
+            False if unable to extent the lock because the resource does not exists
+
+        """
+        pipe = self.redis_server.pipeline(transaction=False)
+        for resource_id in resource_ids:
+            pipe.expire(self.lock_prefix + str(resource_id), expiration)
+        return [bool(ret) for ret in pipe.execute()]
+
     def unlock(self, resource_id):
         """Unlock a resource
 
@@ -196,6 +247,29 @@ class RedisLockingInterface(object):
         #print "UnLock", self.lock_prefix + str(resource_id), str(self)
         return self.call_unlock_resource(keys=keys)
 
+    def unlock_many(self, resource_ids):
+        """Unlock several resources
+
+        All locks are removed in a single pipelined call to the Redis server.
+
+        This function will put a prefix before the resource names
+        to avoid key conflicts with other resources that are logged
+        in the Redis database.
+
+        Args:
+            resource_ids (list): List of resource names to remove the lock, for example ["location/mapset",]
+
+        Returns:
+            list:
+            A list of booleans in the order of resource_ids, True for success and
+            False if unable to unlock
+
+        """
+        pipe = self.redis_server.pipeline(transaction=False)
+        for resource_id in resource_ids:
+            pipe.delete(self.lock_prefix + str(resource_id))
+        return [bool(ret) for ret in pipe.execute()]
+
 
 # Create the Redis interface instance
 # redis_lock_interface = RedisLockingInterface()
@@ -238,6 +312,28 @@ def test_locking(r):
     if ret != 0:
         raise Exception("extend_resource_lock does not work")
 
+    resources = ["location/mapset_a", "location/mapset_b"]
+
+    # Remove the locks if they are present
+    for resource in resources:
+        r.unlock(resource)
+
+    ret = r.lock(resources[1], 5)
+    if ret != 1:
+        raise Exception("lock_resource does not work")
+    ret = r.lock_many(resources, 5)
+    if ret != [True, False]:
+        raise Exception("lock_many does not work")
+    ret = r.lock_many(resources, 5)
+    if ret != [False, False]:
+        raise Exception("lock_many does not work")
+    ret = r.extend_many(resources + ["nothing"], 5)
+    if ret != [True, True, False]:
+        raise Exception("extend_many does not work")
+    ret = r.unlock_many(resources + ["nothing"])
+    if ret != [True, True, False]:
+        raise Exception("unlock_many does not work")
+
 
 if __name__ == '__main__':
     import os, signal
@@ -42,6 +42,8 @@ class RedisResourceInterface(RedisBaseInterface):
     # The database to store the long pending resource status and results
     resource_id_prefix = "RESOURCE-ID::"
     resource_id_termination_prefix = "RESOURCE-ID-TERMINATION::"
+    # The channel to publish termination requests to running jobs
+    resource_id_termination_channel_prefix = "RESOURCE-ID-TERMINATION-CHANNEL::"
 
     def __init__(self):
         """
@@ -131,15 +133,35 @@ class RedisResourceInterface(RedisBaseInterface):
         """Set or update a resource termination entry
 
         The running job will check for termination periodically and will terminate
-        the job if an entry exists.
+        the job if an entry exists. In addition, the termination request is published
+        to the termination channel of the resource.
 
         Args:
             resource_id (str): The unique id of the resource that should be terminated
             expiration (int): The time in seconds when this resource should expire
 
         """
-        return self.redis_server.setex(self.resource_id_termination_prefix + resource_id,
-                                       expiration, True)
+        ret = self.redis_server.setex(self.resource_id_termination_prefix + resource_id,
+                                      expiration, True)
+        self.redis_server.publish(self.resource_id_termination_channel_prefix + resource_id, True)
+        return ret
+
+    def subscribe_termination(self, resource_id):
+        """Subscribe to the termination channel of a resource
+
+        A message is published to this channel each time a termination
+        entry is set for the resource.
+
+        Args:
+            resource_id (str): The unique id of the resource
+
+        Returns:
+            redis.client.PubSub:
+            The PubSub object that is subscribed to the termination channel
+        """
+        pubsub = self.redis_server.pubsub()
+        pubsub.subscribe(self.resource_id_termination_channel_prefix + resource_id)
+        return pubsub
 
     def get(self, resource_id):
         """Get the resource entry if exists
@@ -25,8 +25,8 @@
 Resource logger and management interface
 """
 import sys
-import pickle
 from .redis_resources import RedisResourceInterface
+from .response_document import decode_response_document
 from .redis_fluentd_logger_base import RedisFluentLoggerBase
 
 try:
@@ -65,7 +65,7 @@ class ResourceLogger(RedisFluentLoggerBase):
         Args:
             user_id (str): The user id
             resource_id (str): The resource id
-            document (str): The pickled document to store in the database
+            document (bytes): The encoded response document to store in the database
             expiration (int): Number of seconds of expiration time, default 8640000s hence 100 days
 
         Returns:
@@ -79,7 +79,7 @@ class ResourceLogger(RedisFluentLoggerBase):
         log_entry = "empty"
         data = ""
         try:
-            http_code, data = pickle.loads(document)
+            http_code, data = decode_response_document(document)
             self.send_to_fluent("RESOURCE_LOG", data)
         except Exception as e:
             sys.stderr.write("ResourceLogger ERROR: Unable to connect to fluentd server "
@@ -136,12 +136,12 @@ class ResourceLogger(RedisFluentLoggerBase):
             A list of resource document
 
         """
-        resource_list_pickled = self.db.get_list(user_id + "*")
+        resource_documents = self.db.get_list(user_id + "*")
         resource_list = []
 
-        if resource_list_pickled:
-            for entry in resource_list_pickled:
-                http_code, data = pickle.loads(entry)
+        if resource_documents:
+            for entry in resource_documents:
+                http_code, data = decode_response_document(entry)
                 resource_list.append(data)
 
         return resource_list
@@ -155,12 +155,12 @@ class ResourceLogger(RedisFluentLoggerBase):
 
         """
 
-        resource_list_pickled = self.db.get_list("*")
+        resource_documents = self.db.get_list("*")
         resource_list = []
 
-        if resource_list_pickled:
-            for entry in resource_list_pickled:
-                http_code, data = pickle.loads(entry)
+        if resource_documents:
+            for entry in resource_documents:
+                http_code, data = decode_response_document(entry)
                 resource_list.append(data)
 
         return resource_list
@@ -180,6 +180,21 @@ class ResourceLogger(RedisFluentLoggerBase):
         db_resource_id = self._generate_db_resource_id(user_id, resource_id)
         return self.db.get_termination(db_resource_id)
 
+    def subscribe_termination(self, user_id, resource_id):
+        """Subscribe to the termination requests of a resource
+
+        Args:
+            user_id (str): The user id
+            resource_id (str): The resource id
+
+        Returns:
+            redis.client.PubSub:
+            The PubSub object that receives a message for each termination request
+
+        """
+        db_resource_id = self._generate_db_resource_id(user_id, resource_id)
+        return self.db.subscribe_termination(db_resource_id)
+
     def delete(self, user_id, resource_id):
         """Delete resource entry
 
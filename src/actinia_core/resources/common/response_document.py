@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2016-2018 Sören Gebbert and mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Encoding and decoding of the response documents that are stored in the resource database
+"""
+import datetime
+import json
+import math
+import pickle
+import uuid
+
+try:
+    import orjson
+
+    has_orjson = True
+except:
+    has_orjson = False
+
+__license__ = "GPLv3"
+__author__ = "Sören Gebbert"
+__copyright__ = "Copyright 2016-2018, Sören Gebbert and mundialis GmbH & Co. KG"
+__maintainer__ = "Sören Gebbert"
+__email__ = "soerengebbert@googlemail.com"
+
+# The first byte of a JSON encoded response document. Response documents
+# without this prefix were written by older versions using pickle.
+JSON_DOCUMENT_PREFIX = b"\x01"
+
+
+def _to_json_value(obj):
+    """Convert the values that orjson supports natively but the json module does not
+
+    Args:
+        obj: The object that can not be encoded by the json module
+
+    Returns:
+        str:
+        The string representation that orjson would create
+
+    Raises:
+        TypeError if the object is not supported by orjson
+
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError("Type is not JSON serializable: %s"%type(obj).__name__)
+
+
+def _replace_non_finite_floats(obj):
+    """Replace NaN and infinite floats with None, as orjson encodes them as null
+
+    Args:
+        obj: The object to convert
+
+    Returns:
+        The object with all non-finite floats replaced by None
+
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite_floats(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite_floats(value) for value in obj]
+    return obj
+
+
+def encode_response_document(http_code, response_model):
+    """Encode the http code and the response model as response document
+
+    orjson is used if available, the json module of the standard library otherwise.
+    Both create the same compact documents: NaN and infinite floats are encoded
+    as null, datetime, date, time and UUID objects as strings.
+
+    Args:
+        http_code (int): The HTTP status code
+        response_model (dict): The response model
+
+    Returns:
+        bytes:
+        The JSON encoded response document with a leading version prefix
+
+    """
+    if has_orjson is True:
+        document = orjson.dumps([http_code, response_model],
+                                option=orjson.OPT_NON_STR_KEYS)
+    else:
+        document = json.dumps(_replace_non_finite_floats([http_code, response_model]),
+                              separators=(",", ":"), default=_to_json_value,
+                              allow_nan=False).encode()
+
+    return JSON_DOCUMENT_PREFIX + document
+
+
+def decode_response_document(document):
+    """Decode a response document
+
+    JSON encoded and pickled response documents are supported.
+
+    Args:
+        document (bytes): The response document
+
+    Returns:
+        (int, dict)
+        The http code and the response model
+
+    """
+    if document[:1] == JSON_DOCUMENT_PREFIX:
+        if has_orjson is True:
+            http_code, response_model = orjson.loads(document[1:])
+        else:
+            http_code, response_model = json.loads(document[1:].decode())
+        return http_code, response_model
+
+    http_code, response_model = pickle.loads(document)
+    return http_code, response_model
@@ -24,13 +24,13 @@
 """
 Response models
 """
-import pickle
 import time
 from datetime import datetime
 from flask import jsonify
 from flask_restful_swagger_2 import Schema
 from copy import deepcopy
 from .process_chain import GrassModule
+from .response_document import encode_response_document
 
 __license__ = "GPLv3"
 __author__ = "Sören Gebbert"
@@ -1083,8 +1083,8 @@ def create_response_from_model(response_model_class=ProcessingResponseModel,
                                api_info=None,
                                process_chain_list=[],
                                exception=None,
-                               resp_type="pickle"):
-    """Create a dictionary and its pickle or JSON representation to represent response information
+                               resp_type="document"):
+    """Create a dictionary and its response document or JSON representation to represent response information
 
     This function is used to create almost all responses of Actinia Core
 
@@ -1109,10 +1109,11 @@ def create_response_from_model(response_model_class=ProcessingResponseModel,
         resource_urls ([str]): The list of url of the new created resources
         api_info (ApiInfoModel): Information about the API call, important for accounting
         process_chain_list ([ProcessChainModel]): The list of process chains
-        resp_type (str): What type of response, "pickle" or "json"
+        resp_type (str): What type of response, "document", "json" or "tuple".
+                         "pickle" is accepted as alias for "document".
 
     Returns:
-        A pickle string or json string
+        A response document, json string or a tuple (http_code, response_model)
 
     """
     # if issubclass(response_model_class, ProcessingResponseModel) is False:
@@ -1146,7 +1147,9 @@ def create_response_from_model(response_model_class=ProcessingResponseModel,
     if api_info is not None:
         resp_dict["api_info"] = api_info
 
-    if resp_type == "pickle":
-        return pickle.dumps([http_code, resp_dict])
+    if resp_type in ("document", "pickle"):
+        return encode_response_document(http_code, resp_dict)
+    elif resp_type == "tuple":
+        return http_code, resp_dict
     else:
         return jsonify(resp_dict)
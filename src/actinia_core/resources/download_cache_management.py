@@ -30,7 +30,6 @@ TODO: Tests required
 import os
 from flask import jsonify, make_response
 from flask_restful_swagger_2 import swagger
-import pickle
 from .ephemeral_processing import EphemeralProcessing
 from .persistent_processing import PersistentProcessing
 from .resource_base import ResourceBase
@@ -76,7 +75,7 @@ class SyncDownloadCacheResource(ResourceBase):
             enqueue_job(self.job_timeout, start_download_cache_size, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -102,7 +101,7 @@ class SyncDownloadCacheResource(ResourceBase):
             enqueue_job(self.job_timeout, start_download_cache_remove, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -24,7 +24,6 @@
 """
 Running a custom UNIX process outside the GRASS GIS environment
 """
-import pickle
 from flask import jsonify, make_response
 
 from .ephemeral_processing import EphemeralProcessing
@@ -74,7 +73,7 @@ class AsyncEphemeralCustomResource(ResourceBase):
             rdc.set_user_data(executable)
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
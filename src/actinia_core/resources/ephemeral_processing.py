@@ -26,7 +26,6 @@ Base class for asynchronous processing
 """
 import sys
 import traceback
-import pickle
 import math
 import os
 import shutil
@@ -49,6 +48,7 @@ from .common.exceptions import AsyncProcessError, AsyncProcessTermination
 from .common.exceptions import AsyncProcessTimeLimit
 from .common.response_models import ProcessingResponseModel, ExceptionTracebackModel
 from .common.response_models import create_response_from_model, ProcessLogModel, ProgressInfoModel
+from .common.response_document import decode_response_document
 from .user_auth import check_location_mapset_module_access
 from .resource_base import ResourceBase
 
@@ -133,7 +133,7 @@ class AsyncEphemeralResource(ResourceBase):
         if rdc:
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
@@ -299,6 +299,7 @@ class EphemeralProcessing(object):
         # process chain finished
         self.webhook_update = None  # The URL of a webhook that should be called for each status/progress update
         self.webhook_auth = None # The authentification for the webhook (base 64 decoded "username:password")
+        self.lock_interface = None  # The redis lock interface, initiated in the setup method
 
     def _send_resource_update(self, message, results=None):
         """Create an HTTP response document and send it to the status database
@@ -441,7 +442,7 @@ class EphemeralProcessing(object):
         try:
             if final is True and self.webhook_finished is not None:
                 self.message_logger.info("Send POST request to finished webhook url: %s"%self.webhook_finished)
-                http_code, response_model = pickle.loads(document)
+                http_code, response_model = decode_response_document(document)
                 if self.webhook_auth:
                     r = requests.post(self.webhook_finished, json=json.dumps(response_model), auth=HTTPBasicAuth(self.webhook_auth.split(':')[0], self.webhook_auth.split(':')[1]))
                 else:
@@ -450,7 +451,7 @@ class EphemeralProcessing(object):
                     raise AsyncProcessError("Unable to access finished webhook URL %s"%self.webhook_finished)
             elif final is False and self.webhook_update is not None:
                 self.message_logger.info("Send POST request to update webhook url: %s"%self.webhook_update)
-                http_code, response_model = pickle.loads(document)
+                http_code, response_model = decode_response_document(document)
                 if self.webhook_auth:
                     r = requests.post(self.webhook_update, json=json.dumps(response_model), auth=HTTPBasicAuth(self.webhook_auth.split(':')[0], self.webhook_auth.split(':')[1]))
                 else:
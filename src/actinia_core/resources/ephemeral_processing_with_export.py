@@ -25,7 +25,6 @@
 Asynchronous computation in specific temporary generated mapsets
 with export of required map layers.
 """
-import pickle
 import os
 from flask import jsonify, make_response
 
@@ -123,7 +122,7 @@ class AsyncEphemeralExportResource(ResourceBase):
             rdc.set_storage_model_to_file()
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
@@ -145,7 +144,7 @@ class AsyncEphemeralExportS3Resource(ResourceBase):
 
         enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
@@ -167,7 +166,7 @@ class AsyncEphemeralExportGCSResource(ResourceBase):
 
         enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
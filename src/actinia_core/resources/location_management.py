@@ -30,7 +30,6 @@ TODO: Integrate into the ephemeral process chain approach
 from flask import jsonify, make_response
 import os
 import shutil
-import pickle
 from flask_restful_swagger_2 import swagger, Schema
 from .common.app import auth
 from .common.logging_interface import log_api_call
@@ -190,7 +189,7 @@ class LocationManagementResourceUser(ResourceBase):
             enqueue_job(self.job_timeout, read_current_region, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -313,7 +312,7 @@ class LocationManagementResourceAdmin(ResourceBase):
             enqueue_job(self.job_timeout, create_location, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
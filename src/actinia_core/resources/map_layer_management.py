@@ -26,7 +26,6 @@ Raster layer resources
 """
 from flask import jsonify, make_response
 from flask_restful_swagger_2 import swagger
-import pickle
 from .persistent_processing import PersistentProcessing
 from .resource_base import ResourceBase
 from .common.redis_interface import enqueue_job
@@ -92,7 +91,7 @@ class MapsetLayersResource(ResourceBase):
             enqueue_job(self.job_timeout, list_raster_layers, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -122,7 +121,7 @@ class MapsetLayersResource(ResourceBase):
             enqueue_job(self.job_timeout, remove_raster_layers, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -167,7 +166,7 @@ class MapsetLayersResource(ResourceBase):
             enqueue_job(self.job_timeout, rename_raster_layers, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
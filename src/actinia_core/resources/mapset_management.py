@@ -33,7 +33,6 @@ import shutil
 from flask import jsonify, make_response
 from copy import deepcopy
 from flask_restful_swagger_2 import swagger
-import pickle
 from .persistent_processing import PersistentProcessing
 from .resource_base import ResourceBase
 from .common.app import auth
@@ -95,7 +94,7 @@ class ListMapsetsResource(ResourceBase):
             enqueue_job(self.job_timeout, list_raster_mapsets, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
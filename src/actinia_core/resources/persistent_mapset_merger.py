@@ -24,8 +24,10 @@
 """
 Asynchronous merging of several mapsets into a single one
 """
-import pickle
 import os
+import threading
+import time
+import concurrent.futures
 from flask import jsonify, make_response
 
 from .persistent_processing import PersistentProcessing
@@ -85,7 +87,7 @@ class AsyncPersistentMapsetMergerResource(ResourceBase):
         if rdc:
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
@@ -112,13 +114,28 @@ class PersistentMapsetMerger(PersistentProcessing):
         """
 
         PersistentProcessing.__init__(self, rdc)
-        self.lock_ids = {}                    # This dict holds the lock ids of all locked mapsets
+        self.lock_ids = []                    # This list holds the (lock id, mapset name) tuples of all locked mapsets
+        # The lock ids of all mapsets share the user group and location name
+        self._lock_prefix = self._generate_mapset_lock_id(self.user_group, self.location_name, "")
+        self._heartbeat_stop = threading.Event()  # Set this event to stop the lock heartbeat thread
+        self._heartbeat_thread = None
+        self._heartbeat_error = None          # The error message of a failed lock extension
+        self._terminated = threading.Event()  # This event is set when a termination request was received
+        self._termination_stop = threading.Event()  # Set this event to stop the termination listener
+        self._termination_thread = None
+        self._termination_pubsub = None
+        self._last_status_ts = 0.0            # The time of the last resource update
+        self._status_every = 1.0              # The minimum time in seconds between two resource updates
+        self._merge_step = 0                  # The number of merged source mapsets, written by the main thread only
 
     def _check_lock_mapset(self, mapset_name):
-        """Check if the mapset exists and lock it
+        """Lock the mapset and check if it exists
 
         If the mapset is a global mapset and Error will be raised.
 
+        The mapset is locked before its existence is checked, so that no
+        other process can create or remove it between the check and the lock.
+
         The duration of the lock is process_time_limit * process_num_limit
         and should be extended if needed.
 
@@ -126,14 +143,8 @@ class PersistentMapsetMerger(PersistentProcessing):
 
         Unlock the mapset after the processing finished.
         """
-        # check if the resource is accessible
-        mapset_exists = self._check_mapset(mapset_name)
-
-        if mapset_exists is False:
-            raise AsyncProcessError("Mapset <%s> does not exist and can not be locked."%mapset_name)
-
-        # Finally lock the mapset for the time that the user can allocate at maximum
-        lock_id = "%s/%s/%s"%(self.user_group, self.location_name, mapset_name)
+        # Lock the mapset for the time that the user can allocate at maximum
+        lock_id = self._lock_prefix + mapset_name
         ret = self.lock_interface.lock(resource_id=lock_id,
                                        expiration=self.process_time_limit*self.process_num_limit)
 
@@ -142,26 +153,217 @@ class PersistentMapsetMerger(PersistentProcessing):
         self.message_logger.info("Mapset <%s> locked"%mapset_name)
 
         # if we manage to come here, the lock was correctly set, hence store the lock id for later unlocking
-        self.lock_ids[lock_id] = mapset_name
+        self.lock_ids.append((lock_id, mapset_name))
+
+        # check if the resource is accessible
+        mapset_exists = self._check_mapset(mapset_name)
+
+        if mapset_exists is False:
+            raise AsyncProcessError("Mapset <%s> does not exist."%mapset_name)
+
+    def _validate_source_mapsets(self, source_mapsets):
+        """Check that the source mapsets are provided as a list of legal mapset names
+        that contains at least one mapset that is not the target mapset
+
+        Mapset names follow the rules of GRASS GIS for legal file names:
+        they must not start with a dot and must not contain white space or
+        any of the characters / " ' @ , = * ~
+
+        This check is performed before any mapset is locked.
+
+        Args:
+            source_mapsets: The source mapsets from the request
+
+        Raises:
+            This method will raise an AsyncProcessError
+
+        """
+        if not isinstance(source_mapsets, list):
+            raise AsyncProcessError("The source mapsets must be provided as a list of mapset names.")
+
+        for mapset in source_mapsets:
+            if not isinstance(mapset, str) or not mapset or mapset.startswith(".") or \
+                    any(char.isspace() or char in "/\"'@,=*~" for char in mapset):
+                raise AsyncProcessError("Invalid source mapset name <%s>."%str(mapset))
+
+        if not [mapset for mapset in source_mapsets if mapset != self.target_mapset_name]:
+            raise AsyncProcessError("Empty source mapset list.")
+
+    def _check_mapsets_bulk(self, mapsets):
+        """Check concurrently if the mapsets exist
+
+        The thread pool runs the side effect free _mapset_exists() method.
+
+        Args:
+            mapsets (list): The names of the mapsets that should be checked
+
+        Returns:
+            dict:
+            The mapset names as keys and True if the mapset exists, False otherwise as values
+
+        Raises:
+            This method will raise an AsyncProcessError
+
+        """
+        result = {}
+        max_workers = max(1, min(len(mapsets), 16))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._mapset_exists, mapset): mapset for mapset in mapsets}
+            for future in concurrent.futures.as_completed(futures):
+                result[futures[future]] = future.result()
+        return result
 
     def _check_lock_source_mapsets(self, source_mapsets):
         """Check and lock the source mapsets from the merging list
 
+        The existence of the mapsets is checked before they are locked, to
+        report all missing mapsets without locking, and again after they
+        are locked, so that no other process can have removed them between
+        the check and the lock.
+
         Args:
             source_mapsets: A list of source mapsets that should be checked
                             and locked
 
+        Returns:
+            list:
+            The list of locked source mapsets without duplicates
+
         Raises:
             This method will raise an AsyncProcessError
 
         """
-        # Expect a list of mapset names
-        if len(source_mapsets) == 0:
-            raise AsyncProcessError("Empty source mapset list.")
-
-        # Check and lock the mapsets
+        # Remove duplicates, but keep the order
+        seen = set()
+        unique_mapsets = []
         for mapset in source_mapsets:
-            self._check_lock_mapset(mapset)
+            if mapset not in seen:
+                seen.add(mapset)
+                unique_mapsets.append(mapset)
+        source_mapsets = unique_mapsets
+
+        # Check all mapsets before any lock is set
+        mapsets_exist = self._check_mapsets_bulk(source_mapsets)
+        missing_mapsets = [mapset for mapset in source_mapsets if mapsets_exist[mapset] is False]
+        if missing_mapsets:
+            raise AsyncProcessError("Mapsets <%s> do not exist and can not be "
+                                    "locked."%", ".join(missing_mapsets))
+
+        # Lock all mapsets with a single request for the time that the user can allocate at maximum
+        lock_ids = [self._lock_prefix + mapset for mapset in source_mapsets]
+        ret = self.lock_interface.lock_many(resource_ids=lock_ids,
+                                            expiration=self.process_time_limit*self.process_num_limit)
+
+        # Store the lock ids of all successfully set locks before raising an error,
+        # so that they will be released in the final cleanup
+        for lock_id, mapset, locked in zip(lock_ids, source_mapsets, ret):
+            if locked is True:
+                self.lock_ids.append((lock_id, mapset))
+
+        for mapset, locked in zip(source_mapsets, ret):
+            if locked is False:
+                raise AsyncProcessError("Unable to lock mapset <%s>, resource is already locked"%mapset)
+            self.message_logger.info("Mapset <%s> locked"%mapset)
+
+        # Check again that the now locked mapsets still exist
+        mapsets_exist = self._check_mapsets_bulk(source_mapsets)
+        missing_mapsets = [mapset for mapset in source_mapsets if mapsets_exist[mapset] is False]
+        if missing_mapsets:
+            raise AsyncProcessError("Mapsets <%s> do not exist."%", ".join(missing_mapsets))
+
+        # Add the mapsets to the required ones for mapset search path settings
+        self.required_mapsets.extend(source_mapsets)
+
+        return source_mapsets
+
+    def _extend_locks(self):
+        """Extend all mapset locks by process_time_limit*2 seconds
+
+        Returns:
+            str:
+            The error message if a lock could not be extended, None otherwise
+
+        """
+        locks = list(self.lock_ids)
+        try:
+            ret = self.lock_interface.extend_many(resource_ids=[lock_id for lock_id, _ in locks],
+                                                  expiration=self.process_time_limit * 2)
+        except Exception as e:
+            return "Unable to extend mapset locks: %s"%str(e)
+
+        for (lock_id, mapset_name), extended in zip(locks, ret):
+            if extended is False:
+                return "Unable to extend lock for mapset <%s>"%mapset_name
+        return None
+
+    def _heartbeat_loop(self):
+        """Extend all mapset locks periodically until the heartbeat is stopped
+
+        The locks are extended every process_time_limit/2 seconds by
+        process_time_limit*2 seconds. Errors can not be raised in this thread,
+        hence they are stored in self._heartbeat_error and the heartbeat stops.
+        """
+        interval = max(self.process_time_limit / 2.0, 1)
+        while not self._heartbeat_stop.wait(interval):
+            self._heartbeat_error = self._extend_locks()
+            if self._heartbeat_error is not None:
+                return
+
+    def _start_heartbeat(self):
+        """Extend the locks of all locked mapsets and start the background
+        thread that extends them periodically
+
+        Raises:
+            This method will raise an AsyncProcessError
+
+        """
+        error = self._extend_locks()
+        if error is not None:
+            raise AsyncProcessError(error)
+
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+        self._heartbeat_thread.start()
+
+    def _stop_heartbeat(self):
+        """Stop the lock heartbeat thread and wait for it to finish
+        """
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+
+    def _termination_loop(self):
+        """Wait for termination requests of this resource until the listener is stopped
+        """
+        while not self._termination_stop.is_set():
+            message = self._termination_pubsub.get_message(ignore_subscribe_messages=True,
+                                                           timeout=1.0)
+            if message is not None and message["type"] == "message":
+                self._terminated.set()
+                return
+
+    def _start_termination_listener(self):
+        """Subscribe to the termination channel of this resource and listen for
+        termination requests in a background thread
+
+        Termination requests that were committed before the subscription
+        are detected with a single check of the termination entry.
+        """
+        self._termination_pubsub = self.resource_logger.subscribe_termination(self.user_id,
+                                                                              self.resource_id)
+        if self.resource_logger.get_termination(self.user_id, self.resource_id) is True:
+            self._terminated.set()
+
+        self._termination_thread = threading.Thread(target=self._termination_loop, daemon=True)
+        self._termination_thread.start()
+
+    def _stop_termination_listener(self):
+        """Stop the termination listener thread and close the subscription
+        """
+        self._termination_stop.set()
+        if self._termination_thread is not None:
+            self._termination_thread.join()
+        if self._termination_pubsub is not None:
+            self._termination_pubsub.close()
 
     def _merge_mapsets(self):
         """Merge mapsets in a target mapset
@@ -169,48 +371,175 @@ class PersistentMapsetMerger(PersistentProcessing):
             - Check the target mapset and lock it for the maximum time
               a user can consume -> process_num_limit*process_time_limit
             - Check and lock all source mapsets with the same scheme
-            - Copy each source mapset into the target mapset
-            - Extend the locks each copy run
+            - Extend the locks periodically in a background thread
+            - Copy the source mapsets in parallel into the target mapset
             - Cleanup and unlock the mapsets
 
         """
+        # Check the source mapset list before anything is locked
+        self._validate_source_mapsets(self.request_data)
+        # Listen for termination requests
+        self._start_termination_listener()
         # Lock the target mapset
         self._check_lock_mapset(self.target_mapset_name)
-        # Lock the source mapsets
-        self._check_lock_source_mapsets(self.request_data)
-
-        step = 1
-        steps = len(self.request_data)
-
-        mapsets_to_merge = []
-
-        # Copy each mapset into the target
-        for lock_id in self.lock_ids:
-            # Check for termination requests
-            if self.resource_logger.get_termination(self.user_id, self.resource_id) is True:
-                raise AsyncProcessTermination("Mapset merging was terminated "
-                                              "by user request at setp %i of %i"%(step, steps))
-
-            mapset_name = self.lock_ids[lock_id]
-            mapsets_to_merge.append(mapset_name)
-
-            for lock_id in self.lock_ids:
-                # Extent the lock for each process by max processing time * 2
-                ret = self.lock_interface.extend(resource_id=lock_id,
-                                                 expiration=self.process_time_limit * 2)
-                if ret == 0:
-                    raise AsyncProcessError("Unable to extend lock for mapset <%s>"%mapset_name)
-
-            message = "Step %i of %i: Copy content from source " \
-                      "mapset <%s> into target mapset <%s>"%(step, steps, mapset_name,
-                                                             self.target_mapset_name)
-            self._send_resource_update(message)
-            self.message_logger.info(message)
-
-            # Copy the source mapset into the target mapset
-            if mapset_name != self.target_mapset_name:
-                step += 1
-                self._merge_mapset_into_target(mapset_name, self.target_mapset_name)
+        # Lock the source mapsets, the target mapset is already locked
+        mapsets_to_merge = self._check_lock_source_mapsets([mapset for mapset in self.request_data
+                                                            if mapset != self.target_mapset_name])
+        # Extend the locks while the mapsets are copied
+        self._start_heartbeat()
+
+        step = 0
+        steps = len(mapsets_to_merge)
+
+        self._check_merge_state(step, steps)
+
+        # The directories of the target mapset must exist before several
+        # copy processes write into them concurrently
+        self._create_target_directories(mapsets_to_merge, self.target_mapset_name)
+
+        # Copy the groups of source mapsets in parallel into the target mapset
+        groups = self._group_source_mapsets(mapsets_to_merge)
+        max_workers = max(1, min(len(groups), self.process_num_limit))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._merge_mapset_group_into_target,
+                                       group,
+                                       self.target_mapset_name,
+                                       steps): group
+                       for group in groups}
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    group = futures[future]
+                    # Raise the exception of the copy process if any
+                    future.result()
+
+                    step += len(group)
+                    self._merge_step = step
+                    message = "Step %i of %i: Copied content from source " \
+                              "mapsets <%s> into target mapset <%s>"%(step, steps, ", ".join(group),
+                                                                      self.target_mapset_name)
+                    # Send at most one resource update each self._status_every seconds,
+                    # but always send the last one
+                    now = time.monotonic()
+                    if now - self._last_status_ts > self._status_every or step == steps:
+                        self._send_resource_update(message)
+                        self.message_logger.info(message)
+                        self._last_status_ts = now
+                    else:
+                        self.message_logger.debug(message)
+
+                    self._check_merge_state(step, steps)
+            except:
+                # Do not start the copy processes that are still pending
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _group_source_mapsets(self, source_mapsets):
+        """Group the source mapsets so that each group can be merged independently
+
+        Source mapsets that share a file or directory name in any of the
+        merged directories (for example the same raster or vector map name)
+        are put into the same group, directly or through other source mapsets
+        of the group. The mapsets of a group keep the order of the request,
+        so that merging a group serially keeps the content of the last
+        source mapset, as it was before the copies were run in parallel.
+
+        Args:
+            source_mapsets (list): The names of the source mapsets in request order
+
+        Returns:
+            list:
+            A list of lists of source mapset names
+
+        """
+        owners = {}  # (directory, entry name) -> source mapsets that contain it
+        for source_mapset in source_mapsets:
+            for directory in self.merge_directories:
+                source_path = os.path.join(self.user_location_path, source_mapset, directory)
+                if os.path.isdir(source_path) is False:
+                    continue
+                for entry in os.listdir(source_path):
+                    owners.setdefault((directory, entry), set()).add(source_mapset)
+
+        # Union-find over the source mapsets that share an entry
+        parents = {mapset: mapset for mapset in source_mapsets}
+
+        def find(mapset):
+            while parents[mapset] != mapset:
+                parents[mapset] = parents[parents[mapset]]
+                mapset = parents[mapset]
+            return mapset
+
+        for mapsets in owners.values():
+            mapsets = list(mapsets)
+            root = find(mapsets[0])
+            for mapset in mapsets[1:]:
+                other_root = find(mapset)
+                if other_root != root:
+                    parents[other_root] = root
+
+        # One group per connected component in the order of the request
+        groups = {}
+        for mapset in source_mapsets:
+            groups.setdefault(find(mapset), []).append(mapset)
+
+        return list(groups.values())
+
+    def _merge_mapset_group_into_target(self, source_mapsets, target_mapset, steps):
+        """Merge a group of source mapsets serially into the target mapset
+
+        Args:
+            source_mapsets (list): The names of the source mapsets in merge order
+            target_mapset (str): The name of the target mapset
+            steps (int): The number of merging steps
+
+        Raises:
+            This method will raise an AsyncProcessError or AsyncProcessTermination
+
+        """
+        for source_mapset in source_mapsets:
+            # Check for termination requests and failed lock extensions before each copy
+            self._check_merge_state(self._merge_step, steps)
+            self._merge_mapset_into_target(source_mapset, target_mapset)
+
+    def _check_merge_state(self, step, steps):
+        """Check for termination requests and failed lock extensions
+
+        Args:
+            step (int): The current merging step
+            steps (int): The number of merging steps
+
+        Raises:
+            This method will raise an AsyncProcessError or AsyncProcessTermination
+
+        """
+        # Check for termination requests
+        if self._terminated.is_set():
+            raise AsyncProcessTermination("Mapset merging was terminated "
+                                          "by user request at setp %i of %i"%(step, steps))
+
+        # Check if the locks are still valid
+        if self._heartbeat_error is not None:
+            raise AsyncProcessError(self._heartbeat_error)
+
+    def _create_target_directories(self, source_mapsets, target_mapset):
+        """Create the raster and vector directories in the target mapset that
+        are present in any of the source mapsets
+
+        Args:
+            source_mapsets (list): The names of the source mapsets
+            target_mapset (str): The name of the target mapset
+
+        """
+        for directory in self.merge_directories:
+            target_path = os.path.join(self.user_location_path, target_mapset, directory)
+            if os.path.exists(target_path) is True:
+                continue
+            for source_mapset in source_mapsets:
+                source_path = os.path.join(self.user_location_path, source_mapset, directory)
+                if os.path.exists(source_path) is True:
+                    os.mkdir(target_path)
+                    break
 
     def _execute(self):
         """The _execute() function that does all the magic.
@@ -220,8 +549,8 @@ class PersistentMapsetMerger(PersistentProcessing):
             - Check the target mapset and lock it for the maximum time
               a user can consume -> process_num_limit*process_time_limit
             - Check and lock all source mapsets with the same scheme
-            - Copy each source mapset into the target mapset
-            - Extend the locks each copy run
+            - Extend the locks periodically in a background thread
+            - Copy the source mapsets in parallel into the target mapset
             - Cleanup and unlock the mapsets
 
         """
@@ -232,9 +561,21 @@ class PersistentMapsetMerger(PersistentProcessing):
     def _final_cleanup(self):
         """Final cleanup called in the run function at the very end of processing
         """
-        # Clean up and remove the temporary gisdbase
-        # Unlock mapsets
-        PersistentProcessing._final_cleanup(self)
-        # Unlock the mapsets
-        for lock_id in self.lock_ids:
-            self.lock_interface.unlock(lock_id)
+        # Stop the background threads
+        self._stop_termination_listener()
+        # Stop extending the locks before they are removed
+        self._stop_heartbeat()
+        try:
+            # Clean up and remove the temporary gisdbase, unlock the mapsets of the parent class
+            PersistentProcessing._final_cleanup(self)
+        finally:
+            # Unlock the mapsets with a single request, even if the cleanup failed
+            try:
+                if self.lock_ids:
+                    self.lock_interface.unlock_many([lock_id for lock_id, _ in self.lock_ids])
+            except Exception as e:
+                self.message_logger.error("Unable to unlock mapsets: %s"%str(e))
+            finally:
+                # The lock interface is not used after unlocking, release its connections
+                if self.lock_interface is not None:
+                    self.lock_interface.disconnect()
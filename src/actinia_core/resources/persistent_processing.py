@@ -25,7 +25,6 @@
 Asynchronous computation in specific temporary generated and then copied
 or original mapsets
 """
-import pickle
 import os
 import shutil
 import subprocess
@@ -190,7 +189,7 @@ class AsyncPersistentResource(ResourceBase):
         if rdc:
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
@@ -228,6 +227,12 @@ class PersistentProcessing(EphemeralProcessing):
         - Unlock the two mapsets after processing is finished, terminated or raised an error
 
     """
+    # Raster and vector directories that are merged into a target mapset
+    merge_directories = ["cell", "misc", "fcell",
+                         "cats", "cellhd",
+                         "cell_misc", "colr", "colr2",
+                         "hist", "vector"]
+
     def __init__(self, rdc):
         """Constructor
 
@@ -305,8 +310,35 @@ class PersistentProcessing(EphemeralProcessing):
             AsyncProcessError
 
         """
-        mapset_exists = False
+        mapset_exists = self._mapset_exists(mapset)
+
+        self.orig_mapset_path = os.path.join(self.user_location_path, mapset)
+        if mapset_exists is True:
+            # Add the existing mapset to the required ones for mapset search path settings
+            self.required_mapsets.append(mapset)
+
+        return mapset_exists
+
+    def _mapset_exists(self, mapset):
+        """Check if a mapset exists in the user group location
+
+        In contrast to _check_mapset() this method does not modify any
+        member variable, hence it can be called from several threads.
+
+        If the mapset is in the global database, then an AsyncProcessError will be raised, since
+        global location/mapsets can not be modified.
+
+        Args:
+            mapset (str): The name of the mapset to check
 
+        Returns:
+            bool:
+            True if the mapset exists in the user group location, False otherwise
+
+        Raises:
+            AsyncProcessError
+
+        """
         # Check if the global location is accessible and that the target mapset does not exist
         if self.is_global_database is True:
             # Break if the target mapset exists in the global database
@@ -314,38 +346,32 @@ class PersistentProcessing(EphemeralProcessing):
                     os.path.isdir(self.global_location_path) and \
                             os.access(self.global_location_path, os.R_OK | os.X_OK | os.W_OK) is True:
 
-                self.orig_mapset_path = os.path.join(self.global_location_path, mapset)
+                global_mapset_path = os.path.join(self.global_location_path, mapset)
 
-                if os.path.exists(self.orig_mapset_path) is True:
-                    if os.access(self.orig_mapset_path, os.R_OK | os.X_OK | os.W_OK) is True:
+                if os.path.exists(global_mapset_path) is True:
+                    if os.access(global_mapset_path, os.R_OK | os.X_OK | os.W_OK) is True:
                         raise AsyncProcessError("Mapset <%s> exists in the global "
                                                 "dataset and can not be modified."%mapset)
             else:
                 raise AsyncProcessError("Unable to access global location <%s>"%self.location_name)
 
-        # Always check if the targte mapset already exists and set the flag accordingly
+        # Always check if the targte mapset already exists
         if os.path.exists(self.user_location_path) and \
                 os.path.isdir(self.user_location_path) and \
                         os.access(self.user_location_path, os.R_OK | os.X_OK | os.W_OK) is True:
 
-            self.orig_mapset_path = os.path.join(self.user_location_path, mapset)
+            mapset_path = os.path.join(self.user_location_path, mapset)
 
-            if os.path.exists(self.orig_mapset_path) is True:
-                if os.access(self.orig_mapset_path, os.R_OK | os.X_OK | os.W_OK) is True:
-                    mapset_exists = True
-                    # Add the existing mapset to the required ones for mapset search path settings
-                    self.required_mapsets.append(mapset)
+            if os.path.exists(mapset_path) is True:
+                if os.access(mapset_path, os.R_OK | os.X_OK | os.W_OK) is True:
+                    return True
                 else:
                     raise AsyncProcessError("Unable to access mapset <%s> "
-                                            "path %s"%(mapset,
-                                            self.orig_mapset_path))
-            else:
-                mapset_exists = False
+                                            "path %s"%(mapset, mapset_path))
+            return False
         else:
             raise AsyncProcessError("Unable to access user location <%s>"%self.location_name)
 
-        return mapset_exists
-
     def _check_lock_target_mapset(self):
         """Check if the target mapset exists and lock it, then lock the temporary mapset
 
@@ -397,30 +423,28 @@ class PersistentProcessing(EphemeralProcessing):
         self.message_logger.info("Copy source mapset <%s> content "
                                  "into the target mapset <%s>"%(source_mapset, target_mapset))
 
-        # Raster adn vector directories
-        directories = ["cell", "misc", "fcell",
-                       "cats", "cellhd",
-                       "cell_misc", "colr", "colr2",
-                       "hist", "vector"]
+        target_path = os.path.join(self.user_location_path, target_mapset)
+        source_paths = []
 
-        for directory in directories:
+        for directory in self.merge_directories:
             source_path = os.path.join(self.user_location_path, source_mapset, directory)
-            target_path = os.path.join(self.user_location_path, target_mapset)
-
             if os.path.exists(source_path) is True:
-                # Hardlink the sources into the target
-                stdout=subprocess.PIPE
-                stderr=subprocess.PIPE
-
-                p = subprocess.Popen(["/bin/cp", "-flr",
-                                      "%s"%source_path,
-                                      "%s/."%target_path],
-                                     stdout=stdout,
-                                     stderr=stderr)
-                (stdout_buff, stderr_buff) = p.communicate()
-                if p.returncode != 0:
-                    raise AsyncProcessError("Unable to merge mapsets. Error in linking:"
-                                            " stdout: %s stderr: %s"%(stdout_buff, stderr_buff))
+                source_paths.append(source_path)
+
+        if not source_paths:
+            return
+
+        # Hardlink all sources into the target with a single process
+        stdout=subprocess.PIPE
+        stderr=subprocess.PIPE
+
+        p = subprocess.Popen(["/bin/cp", "-flr"] + source_paths + ["%s/."%target_path],
+                             stdout=stdout,
+                             stderr=stderr)
+        (stdout_buff, stderr_buff) = p.communicate()
+        if p.returncode != 0:
+            raise AsyncProcessError("Unable to merge mapsets. Error in linking:"
+                                    " stdout: %s stderr: %s"%(stdout_buff, stderr_buff))
 
     def _copy_merge_tmp_mapset_to_target_mapset(self):
         """Copy the temporary mapset into the original location
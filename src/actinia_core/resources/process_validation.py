@@ -25,7 +25,6 @@
 Compute areal categorical statistics on a raster map layer based on an input polygon.
 """
 
-import pickle
 from copy import deepcopy
 from flask_restful_swagger_2 import swagger
 from flask import jsonify, make_response
@@ -101,7 +100,7 @@ class AsyncProcessValidationResource(ResourceBase):
             rdc.set_storage_model_to_file()
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
@@ -121,7 +120,7 @@ class SyncProcessValidationResource(ResourceBase):
             enqueue_job(self.job_timeout, start_job, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
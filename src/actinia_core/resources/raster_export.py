@@ -28,7 +28,6 @@ The region settings of the mapset
 or the raster layer region are used for export.
 """
 from flask import jsonify, make_response
-import pickle
 from flask_restful_swagger_2 import swagger, Schema
 from .resource_base import ResourceBase
 from .ephemeral_processing_with_export import EphemeralProcessingWithExport
@@ -111,7 +110,7 @@ class AsyncEphemeralRasterLayerExporterResource(ResourceBase):
             rdc.set_user_data(use_raster_region)
             enqueue_job(self.job_timeout, start_job, rdc)
 
-        html_code, response_model = pickle.loads(self.response_data)
+        html_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), html_code)
 
 
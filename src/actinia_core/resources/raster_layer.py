@@ -27,7 +27,6 @@ Raster layer resources
 from flask import jsonify, make_response
 from copy import deepcopy
 from flask_restful_swagger_2 import swagger, Schema
-import pickle
 from .ephemeral_processing import EphemeralProcessing
 from .persistent_processing import PersistentProcessing
 from .common.redis_interface import enqueue_job
@@ -271,7 +270,7 @@ class RasterLayerResource(MapLayerRegionResourceBase):
             enqueue_job(self.job_timeout, start_info_job, rdc)
             http_code, response_model = self.wait_until_finish(0.02)
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -325,7 +324,7 @@ class RasterLayerResource(MapLayerRegionResourceBase):
             enqueue_job(self.job_timeout, start_delete_job, rdc)
             http_code, response_model = self.wait_until_finish(0.1)
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -390,7 +389,7 @@ class RasterLayerResource(MapLayerRegionResourceBase):
             enqueue_job(self.job_timeout, start_create_job, rdc)
             http_code, response_model = self.wait_until_finish(0.1)
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
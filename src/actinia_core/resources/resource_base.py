@@ -24,7 +24,6 @@
 """
 Base class for asynchronous and synchronous responses
 """
-import pickle
 import time
 import uuid
 from datetime import datetime
@@ -41,6 +40,7 @@ from .common.resources_logger import ResourceLogger
 from .common.resource_data_container import ResourceDataContainer
 from .common.response_models import ProcessingResponseModel
 from .common.response_models import create_response_from_model, ApiInfoModel
+from .common.response_document import encode_response_document, decode_response_document
 from .resource_streamer import RequestStreamerResource
 from .user_auth import check_user_permissions, create_dummy_user
 from .resource_management import ResourceManager
@@ -119,6 +119,7 @@ class ResourceBase(Resource):
         self.resource_url = None
         self.request_data = None
         self.response_data = None
+        self.response_tuple = None  # The (http_code, response_model) tuple of self.response_data
         self.job_timeout = 0
 
         # Replace this with the correct response model in subclasses
@@ -141,18 +142,20 @@ class ResourceBase(Resource):
             http_code: The hhtp code by default 400
 
         """
-        self.response_data = create_response_from_model(self.response_model_class,
-                                                        status=status,
-                                                        user_id=self.user_id,
-                                                        resource_id=self.resource_id,
-                                                        process_log=None,
-                                                        results={},
-                                                        message=message,
-                                                        http_code=http_code,
-                                                        orig_time=self.orig_time,
-                                                        orig_datetime=self.orig_datetime,
-                                                        status_url=self.status_url,
-                                                        api_info=self.api_info)
+        self.response_tuple = create_response_from_model(self.response_model_class,
+                                                         status=status,
+                                                         user_id=self.user_id,
+                                                         resource_id=self.resource_id,
+                                                         process_log=None,
+                                                         results={},
+                                                         message=message,
+                                                         http_code=http_code,
+                                                         orig_time=self.orig_time,
+                                                         orig_datetime=self.orig_datetime,
+                                                         status_url=self.status_url,
+                                                         api_info=self.api_info,
+                                                         resp_type="tuple")
+        self.response_data = encode_response_document(*self.response_tuple)
 
     def get_error_response(self, message, status="error", http_code=400):
         """Return the error response.
@@ -173,7 +176,7 @@ class ResourceBase(Resource):
         self.resource_logger.commit(user_id=self.user_id,
                                     resource_id=self.resource_id,
                                     document=self.response_data)
-        http_code, response_model = pickle.loads(self.response_data)
+        http_code, response_model = self.response_tuple
         return make_response(jsonify(response_model), http_code)
 
     def check_for_json(self):
@@ -278,18 +281,20 @@ class ResourceBase(Resource):
             self.resource_url_base = self.resource_url_base.replace("http://", "https://")
 
         # Create the accepted response that will be always send
-        self.response_data = create_response_from_model(self.response_model_class,
-                                                        status="accepted",
-                                                        user_id=self.user_id,
-                                                        resource_id=self.resource_id,
-                                                        process_log=None,
-                                                        results={},
-                                                        message="Resource accepted",
-                                                        http_code=200,
-                                                        orig_time=self.orig_time,
-                                                        orig_datetime=self.orig_datetime,
-                                                        status_url=self.status_url,
-                                                        api_info=self.api_info)
+        self.response_tuple = create_response_from_model(self.response_model_class,
+                                                         status="accepted",
+                                                         user_id=self.user_id,
+                                                         resource_id=self.resource_id,
+                                                         process_log=None,
+                                                         results={},
+                                                         message="Resource accepted",
+                                                         http_code=200,
+                                                         orig_time=self.orig_time,
+                                                         orig_datetime=self.orig_datetime,
+                                                         status_url=self.status_url,
+                                                         api_info=self.api_info,
+                                                         resp_type="tuple")
+        self.response_data = encode_response_document(*self.response_tuple)
 
         # Send the status to the database
         self.resource_logger.commit(self.user_id, self.resource_id, self.response_data)
@@ -348,7 +353,7 @@ class ResourceBase(Resource):
                                                                                            self.resource_id)
                 return make_response(message, 400)
 
-            http_code, response_model = pickle.loads(response_data)
+            http_code, response_model = decode_response_document(response_data)
             if response_model["status"] == "finished" \
                     or response_model["status"] == "error" \
                     or response_model["status"] == "timeout" \
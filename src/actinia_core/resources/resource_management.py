@@ -26,7 +26,6 @@ This module takes care of the status requests that are generated by asynchronous
 processes.
 """
 
-import pickle
 from flask import g
 from flask import jsonify, make_response
 from flask_restful_swagger_2 import Resource
@@ -39,6 +38,7 @@ from .common.logging_interface import log_api_call
 from .common.user import ActiniaUser
 from .common.response_models import ProcessingResponseModel, SimpleResponseModel,\
     ProcessingResponseListModel
+from .common.response_document import decode_response_document
 
 __license__ = "GPLv3"
 __author__ = "Sören Gebbert"
@@ -169,7 +169,7 @@ class ResourceManager(ResourceManagerBase):
         response_data = self.resource_logger.get(user_id, resource_id)
 
         if response_data is not None:
-            http_code, response_model = pickle.loads(response_data)
+            http_code, response_model = decode_response_document(response_data)
             return make_response(jsonify(response_model), http_code)
         else:
             return make_response(jsonify(SimpleResponseModel(status="error",
@@ -30,7 +30,6 @@ TODO: Tests required
 import os
 from flask import jsonify, make_response
 from flask_restful_swagger_2 import swagger
-import pickle
 from .ephemeral_processing import EphemeralProcessing
 from .persistent_processing import PersistentProcessing
 from .resource_base import ResourceBase
@@ -79,7 +78,7 @@ class SyncResourceStorageResource(ResourceBase):
             enqueue_job(self.job_timeout, start_resource_storage_size, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -105,7 +104,7 @@ class SyncResourceStorageResource(ResourceBase):
             enqueue_job(self.job_timeout, start_resource_storage_remove, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -26,7 +26,6 @@ STRDS map layer management
 
 TODO: Integrate into the ephemeral process chain approach
 """
-import pickle
 from flask import jsonify, make_response
 from flask_restful import reqparse
 from copy import deepcopy
@@ -105,7 +104,7 @@ class SyncSTRDSListerResource(ResourceBase):
             enqueue_job(self.job_timeout, list_raster_mapsets, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -419,7 +418,7 @@ class STRDSManagementResource(ResourceBase):
             enqueue_job(self.job_timeout, strds_info, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -484,7 +483,7 @@ class STRDSManagementResource(ResourceBase):
             enqueue_job(self.job_timeout, strds_delete, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -546,7 +545,7 @@ class STRDSManagementResource(ResourceBase):
             enqueue_job(self.job_timeout, strds_create, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
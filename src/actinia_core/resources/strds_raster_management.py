@@ -30,7 +30,6 @@ from flask_restful_swagger_2 import swagger, Schema
 from flask import jsonify, make_response
 from copy import deepcopy
 import tempfile
-import pickle
 from .common.request_parser import where_parser
 from .persistent_processing import PersistentProcessing
 from .resource_base import ResourceBase
@@ -291,7 +290,7 @@ class STRDSRasterManagement(ResourceBase):
             enqueue_job(self.job_timeout, list_raster_strds, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -353,7 +352,7 @@ class STRDSRasterManagement(ResourceBase):
             enqueue_job(self.job_timeout, register_raster, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -415,7 +414,7 @@ class STRDSRasterManagement(ResourceBase):
             enqueue_job(self.job_timeout, unregister_raster, rdc)
             http_code, response_model = self.wait_until_finish()
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
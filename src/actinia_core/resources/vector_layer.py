@@ -28,7 +28,6 @@ import random
 from flask import jsonify, make_response
 from copy import deepcopy
 from flask_restful_swagger_2 import swagger, Schema
-import pickle
 from .ephemeral_processing import EphemeralProcessing
 from .persistent_processing import PersistentProcessing
 from .common.redis_interface import enqueue_job
@@ -436,7 +435,7 @@ class VectorLayerResource(MapLayerRegionResourceBase):
             enqueue_job(self.job_timeout, start_info_job, rdc)
             http_code, response_model = self.wait_until_finish(0.02)
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -492,7 +491,7 @@ class VectorLayerResource(MapLayerRegionResourceBase):
             enqueue_job(self.job_timeout, start_delete_job, rdc)
             http_code, response_model = self.wait_until_finish(0.1)
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
@@ -557,7 +556,7 @@ class VectorLayerResource(MapLayerRegionResourceBase):
             enqueue_job(self.job_timeout, start_create_job, rdc)
             http_code, response_model = self.wait_until_finish(0.1)
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.response_tuple
 
         return make_response(jsonify(response_model), http_code)
 
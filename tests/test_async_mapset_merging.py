@@ -25,6 +25,7 @@
 Tests: Async process mapset test case admin
 """
 import unittest
+from copy import deepcopy
 from flask.json import dumps as json_dumps
 from flask.json import loads as json_load
 import time
@@ -103,6 +104,10 @@ process_chain_short_2 = {
    }
 }
 
+# The same output maps as process_chain_short_1 with a different resolution
+process_chain_short_1_res_500 = deepcopy(process_chain_short_1)
+process_chain_short_1_res_500[1]["inputs"]["res"] = "500"
+
 test_mapsets = ["Source_A", "Source_B", "Source_C", "Source_D", "Target"]
 
 
@@ -207,6 +212,128 @@ class AsyncProcessMapsetTestCaseAdmin(ActiniaResourceTestCaseBase):
         self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header, http_status=400, status="error",
                                        message_check="AsyncProcessError")
 
+    def test_4a_merge_duplicated_source_mapsets(self):
+        """Test that duplicated source mapsets are merged once
+        """
+        self.check_remove_test_mapsets()
+
+        ############################################################################
+        # Create the source mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Source_A/processing_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(process_chain_short_1),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        ############################################################################
+        # Create target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target',
+                              headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        self.assertEqual(rv.mimetype, "application/json", "Wrong mimetype %s"%rv.mimetype)
+
+        ############################################################################
+        # Merge source mapsets into target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/merging_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(["Source_A", "Source_A"]),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        ############################################################################
+        # Check that the maps of the source mapset were merged
+        rv = self.server.get(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/raster_layers',
+                             headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        map_list = json_load(rv.data)["process_results"]
+        self.assertTrue("my_aspect_1" in map_list)
+        self.assertTrue("my_slope_1" in map_list)
+
+    def test_4b_merge_target_in_source_mapsets(self):
+        """Test that the target mapset is ignored in the source mapset list
+        """
+        self.check_remove_test_mapsets()
+
+        ############################################################################
+        # Create the source mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Source_A/processing_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(process_chain_short_1),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        ############################################################################
+        # Create target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target',
+                              headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        self.assertEqual(rv.mimetype, "application/json", "Wrong mimetype %s"%rv.mimetype)
+
+        ############################################################################
+        # Merge source mapsets into target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/merging_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(["Target", "Source_A"]),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        ############################################################################
+        # Check that the maps of the source mapset were merged
+        rv = self.server.get(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/raster_layers',
+                             headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        map_list = json_load(rv.data)["process_results"]
+        self.assertTrue("my_aspect_1" in map_list)
+        self.assertTrue("my_slope_1" in map_list)
+
+    def test_4c_merge_invalid_source_mapset_names_error(self):
+        """Test error for invalid source mapset names
+        """
+        self.check_remove_test_mapsets()
+
+        ############################################################################
+        # Create target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target',
+                              headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        self.assertEqual(rv.mimetype, "application/json", "Wrong mimetype %s"%rv.mimetype)
+
+        ############################################################################
+        # Try merge source mapsets into target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/merging_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps([1, "x/y"]),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header, http_status=400, status="error",
+                                       message_check="Invalid source mapset name")
+
+    def test_4d_merge_two_missing_source_mapsets_error(self):
+        """Test that all missing source mapsets are listed in the error message
+        """
+        self.check_remove_test_mapsets()
+
+        ############################################################################
+        # Create target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target',
+                              headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        self.assertEqual(rv.mimetype, "application/json", "Wrong mimetype %s"%rv.mimetype)
+
+        ############################################################################
+        # Try merge source mapsets into target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/merging_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(["Source_A", "Source_B"]),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header, http_status=400, status="error",
+                                       message_check="Mapsets <Source_A, Source_B> do not exist")
+
     def test_5_merge_two_mapsets(self):
         """Test the merging of two mapsets into a target mapset
         """
@@ -263,6 +390,54 @@ class AsyncProcessMapsetTestCaseAdmin(ActiniaResourceTestCaseBase):
 
         time.sleep(1)
 
+    def test_6_merge_two_mapsets_with_equal_map_names(self):
+        """Test that the last source mapset wins if two source mapsets contain maps with the same name
+        """
+        self.check_remove_test_mapsets()
+
+        ############################################################################
+        # Create the source mapsets with equal map names and different resolutions
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Source_A/processing_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(process_chain_short_1),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Source_B/processing_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(process_chain_short_1_res_500),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        ############################################################################
+        # Create target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target',
+                              headers=self.admin_auth_header)
+        print(rv.data)
+        self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+        self.assertEqual(rv.mimetype, "application/json", "Wrong mimetype %s"%rv.mimetype)
+
+        ############################################################################
+        # Merge source mapsets into target mapset
+        rv = self.server.post(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/merging_async',
+                              headers=self.admin_auth_header,
+                              data=json_dumps(["Source_A", "Source_B"]),
+                              content_type="application/json")
+        self.waitAsyncStatusAssertHTTP(rv, headers=self.admin_auth_header)
+
+        ############################################################################
+        # Check that the maps of Source_B were merged last
+        for map_name in ["my_aspect_1", "my_slope_1"]:
+            rv = self.server.get(URL_PREFIX + '/locations/nc_spm_08/mapsets/Target/raster_layers/%s'%map_name,
+                                 headers=self.admin_auth_header)
+            print(rv.data)
+            self.assertEqual(rv.status_code, 200, "HTML status code is wrong %i"%rv.status_code)
+            info = json_load(rv.data)["process_results"]
+            self.assertEqual(float(info["nsres"]), 500.0)
+            self.assertEqual(float(info["ewres"]), 500.0)
+
+        time.sleep(1)
+
 
 if __name__ == '__main__':
     unittest.main()
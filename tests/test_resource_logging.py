@@ -25,9 +25,9 @@
 Tests: Resource logging test case
 """
 import unittest
-import pickle
 import uuid
 from actinia_core.resources.common.resources_logger import ResourceLogger
+from actinia_core.resources.common.response_document import encode_response_document
 from actinia_core.resources.common.app import flask_app
 try:
     from .test_resource_base import ActiniaResourceTestCaseBase, global_config
@@ -53,7 +53,7 @@ class ResourceLoggingTestCase(ActiniaResourceTestCaseBase):
         # The test user
         self.user_id = "soeren"
         self.resource_id = uuid.uuid1()
-        self.document = pickle.dumps({"Status":"running", "URL":"/bla/bla"})
+        self.document = encode_response_document(200, {"Status":"running", "URL":"/bla/bla"})
         self.log = ResourceLogger(global_config.REDIS_SERVER_URL,
                                   global_config.REDIS_SERVER_PORT)
 
@@ -148,11 +148,25 @@ class ResourceLoggingTestCase(ActiniaResourceTestCaseBase):
 
     def test_termination(self):
 
+        pubsub = self.log.subscribe_termination(user_id=self.user_id,
+                                                resource_id=self.resource_id)
+
         ret = self.log.commit_termination(user_id=self.user_id,
                                           resource_id=self.resource_id)
 
         self.assertTrue(ret)
 
+        # The termination request must be published to the subscribers
+        message = None
+        for i in range(5):
+            message = pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is not None:
+                break
+        pubsub.close()
+
+        self.assertIsNotNone(message)
+        self.assertEqual(message["type"], "message")
+
         ret = self.log.get_termination(user_id=self.user_id,
                                        resource_id=self.resource_id)
 
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2016-2018 Sören Gebbert and mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Tests: Response document encoding test case
+"""
+import unittest
+import datetime
+import pickle
+import uuid
+from actinia_core.resources.common import response_document
+from actinia_core.resources.common.response_document import encode_response_document, \
+    decode_response_document, JSON_DOCUMENT_PREFIX
+
+__license__ = "GPLv3"
+__author__ = "Sören Gebbert"
+__copyright__ = "Copyright 2016-2018, Sören Gebbert and mundialis GmbH & Co. KG"
+__maintainer__ = "Sören Gebbert"
+__email__ = "soerengebbert@googlemail.com"
+
+
+class ResponseDocumentTestCase(unittest.TestCase):
+    """
+    This class tests the encoding and decoding of the response documents
+    that are stored in the resource database
+    """
+
+    response_model = {"status": "finished",
+                      "message": "Processing successfully finished",
+                      "resource_id": "resource_id-4846cbcc-3918-4654-bf4d-7e1ba2b59ce6",
+                      "process_log": [{"executable": "g.list", "parameter": ["type=raster"],
+                                       "return_code": 0}],
+                      "progress": {"step": 1, "num_of_steps": 1},
+                      "process_results": {"nsres": 500.0, "maps": ["elevation", "slope"]},
+                      "accept_timestamp": 1526032453.1234,
+                      "exception": None,
+                      "urls": {"resources": [], "status": "http://localhost/resources/user/id"}}
+
+    def setUp(self):
+        self.has_orjson = response_document.has_orjson
+
+    def tearDown(self):
+        response_document.has_orjson = self.has_orjson
+
+    def check_round_trip(self):
+        document = encode_response_document(200, self.response_model)
+
+        self.assertTrue(isinstance(document, bytes))
+        self.assertEqual(document[:1], JSON_DOCUMENT_PREFIX)
+
+        http_code, response_model = decode_response_document(document)
+        self.assertEqual(http_code, 200)
+        self.assertEqual(response_model, self.response_model)
+
+    def test_round_trip(self):
+        self.check_round_trip()
+
+    def test_round_trip_json(self):
+        response_document.has_orjson = False
+        self.check_round_trip()
+
+    @unittest.skipIf(response_document.has_orjson is False, "orjson is not installed")
+    def test_round_trip_orjson(self):
+        self.check_round_trip()
+
+    @unittest.skipIf(response_document.has_orjson is False, "orjson is not installed")
+    def test_orjson_json_compatibility(self):
+        # Documents written with orjson must be readable with the json module and vice versa
+        document = encode_response_document(400, self.response_model)
+        response_document.has_orjson = False
+        self.assertEqual(decode_response_document(document), (400, self.response_model))
+
+        document = encode_response_document(400, self.response_model)
+        response_document.has_orjson = True
+        self.assertEqual(decode_response_document(document), (400, self.response_model))
+
+    @unittest.skipIf(response_document.has_orjson is False, "orjson is not installed")
+    def test_orjson_json_equal_documents(self):
+        # Non-finite floats, datetime and UUID values must be encoded equally by orjson and the json module
+        response_model = {"process_results": {"min": float("nan"), "max": float("inf"),
+                                              "values": (float("-inf"), 1.5)},
+                          "accept_datetime": datetime.datetime(2018, 5, 2, 10, 53, 20, 254387),
+                          "date": datetime.date(2018, 5, 2),
+                          "time": datetime.time(10, 53, 20),
+                          "utc_datetime": datetime.datetime(2018, 5, 2, 10, 53, 20,
+                                                            tzinfo=datetime.timezone.utc),
+                          "resource_id": uuid.UUID("4846cbcc-3918-4654-bf4d-7e1ba2b59ce6")}
+        expected_model = {"process_results": {"min": None, "max": None, "values": [None, 1.5]},
+                          "accept_datetime": "2018-05-02T10:53:20.254387",
+                          "date": "2018-05-02",
+                          "time": "10:53:20",
+                          "utc_datetime": "2018-05-02T10:53:20+00:00",
+                          "resource_id": "4846cbcc-3918-4654-bf4d-7e1ba2b59ce6"}
+
+        response_document.has_orjson = True
+        orjson_document = encode_response_document(200, response_model)
+        response_document.has_orjson = False
+        json_document = encode_response_document(200, response_model)
+
+        self.assertEqual(json_document, orjson_document)
+
+        for has_orjson in [True, False]:
+            response_document.has_orjson = has_orjson
+            self.assertEqual(decode_response_document(orjson_document), (200, expected_model))
+            self.assertEqual(decode_response_document(json_document), (200, expected_model))
+
+    def test_legacy_pickle_document(self):
+        document = pickle.dumps([200, self.response_model])
+
+        http_code, response_model = decode_response_document(document)
+        self.assertEqual(http_code, 200)
+        self.assertEqual(response_model, self.response_model)
+
+    def test_non_json_value_error(self):
+        response_model = {"status": "finished", "process_results": object()}
+
+        response_document.has_orjson = False
+        self.assertRaises(TypeError, encode_response_document, 200, response_model)
+
+        if self.has_orjson is True:
+            response_document.has_orjson = True
+            self.assertRaises(TypeError, encode_response_document, 200, response_model)
+
+if __name__ == '__main__':
+    unittest.main()